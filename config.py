@@ -1,3 +1,8 @@
+# isort: off
+# Starts profiling, when enabled, before any other import, so the `import` stage covers the registry SDK too
+from utils import profiling
+# isort: on
+
 import logging
 import os
 from dataclasses import dataclass
@@ -59,14 +64,15 @@ def _load_config() -> Config:
 def get_config() -> Config:
     global _config
     if _config is None:
-        _config = _load_config()
+        with profiling.stage("config"):
+            _config = _load_config()
     return _config
 
 
 if __name__ == "__main__":
     from utils.setup import main
 
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
 else:
     # Load config for all imports except when running setup
     config = get_config()
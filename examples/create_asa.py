@@ -14,7 +14,7 @@ from asa_metadata_registry import Arc90Compliance, Arc90Uri
 from dotenv import set_key
 
 from config import config
-from utils import get_algorand_client, get_caller_address
+from utils import get_algorand_client, get_caller_address, profiling
 
 logger = logging.getLogger(__name__)
 
@@ -82,4 +82,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
@@ -26,7 +26,7 @@ from asa_metadata_registry import (
 from asa_metadata_registry._generated.asa_metadata_registry_client import AsaMetadataRegistryClient
 
 from config import config
-from utils import check_existence, get_asset, get_asset_id
+from utils import check_existence, get_asset, get_asset_id, profiling
 from utils.runtime import get_algorand_client, get_caller_signer
 
 logger = logging.getLogger(__name__)
@@ -61,8 +61,11 @@ DEPRECATED_BY = 0
 
 
 def create_metadata(
-    algorand_client: AlgorandClient, caller: SigningAccount, asset_id: int
+    algorand_client: AlgorandClient, caller: SigningAccount, asset_id: int, metadata_json: dict | None = None
 ) -> tuple[AssetMetadata, MbrDelta]:
+    if metadata_json is None:
+        metadata_json = METADATA_JSON
+
     app_client = algorand_client.client.get_typed_app_client_by_id(
         AsaMetadataRegistryClient,
         app_id=config.metadata_registry_app_id,
@@ -74,10 +77,10 @@ def create_metadata(
 
     metadata = AssetMetadata.from_json(
         asset_id=asset_id,
-        json_obj=METADATA_JSON,
+        json_obj=metadata_json,
         flags=METADATA_FLAGS,
         deprecated_by=DEPRECATED_BY,
-        arc3_compliant=is_arc3_metadata(METADATA_JSON),
+        arc3_compliant=is_arc3_metadata(metadata_json),
     )
 
     mbr_result = registry.write.create_metadata(asset_manager=caller, metadata=metadata)
@@ -101,4 +104,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
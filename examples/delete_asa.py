@@ -5,7 +5,7 @@ Delete an ASA by ID.
 import logging
 
 from config import config  # noqa: F401 - Loads environment variables
-from utils import delete_asset, get_algorand_client, get_asset_id, get_caller_address
+from utils import delete_asset, get_algorand_client, get_asset_id, get_caller_address, profiling
 
 logger = logging.getLogger(__name__)
 
@@ -34,4 +34,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
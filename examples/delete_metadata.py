@@ -20,7 +20,7 @@ from asa_metadata_registry import (
 from asa_metadata_registry._generated.asa_metadata_registry_client import AsaMetadataRegistryClient
 
 from config import config
-from utils import check_existence, get_algorand_client, get_asset_id, get_caller_signer
+from utils import check_existence, get_algorand_client, get_asset_id, get_caller_signer, profiling
 
 logger = logging.getLogger(__name__)
 
@@ -64,4 +64,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
@@ -6,7 +6,7 @@ import json
 import logging
 
 from config import config  # noqa: F401 - Loads environment variables
-from utils import get_algorand_client, get_asset, get_asset_id
+from utils import get_algorand_client, get_asset, get_asset_id, profiling
 
 logger = logging.getLogger(__name__)
 
@@ -31,4 +31,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
@@ -12,7 +12,7 @@ from algokit_utils import AlgorandClient
 from asa_metadata_registry import AsaMetadataRegistry, AssetMetadataRecord, MetadataSource
 
 from config import config
-from utils import check_existence, get_algorand_client, get_asset_id
+from utils import check_existence, get_algorand_client, get_asset_id, profiling
 
 logger = logging.getLogger(__name__)
 
@@ -69,4 +69,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
@@ -1 +1 @@
-
+import utils  # noqa: F401 - Starts profiling, when enabled, before the scripts' own imports
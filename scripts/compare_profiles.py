@@ -0,0 +1,74 @@
+"""
+Compare the stage breakdown of two profiled runs (see `--profile`).
+
+Usage:
+    python -m scripts.compare_profiles                      # two latest runs of the same entry point
+    python -m scripts.compare_profiles <baseline_dir> <run_dir> [--threshold 20]
+
+Exits with 1 when a stage's wall time grew by more than `--threshold` percent.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from utils import profiling
+
+# Stages shorter than this are too noisy to flag as regressions
+MIN_FLAGGED_WALL_S = 0.01
+
+
+def _load(run_dir: Path) -> dict:
+    summary: dict = json.loads((run_dir / "stages.json").read_text())
+    return summary
+
+
+def _latest_runs(profile_dir: Path) -> tuple[Path, Path]:
+    runs = sorted(path for path in profile_dir.iterdir() if (path / "stages.json").is_file())
+    if not runs:
+        raise ValueError(f"No profiled runs in {profile_dir}")
+    entry_point = _load(runs[-1])["entry_point"]
+    same_entry_point = [run for run in runs if _load(run)["entry_point"] == entry_point]
+    if len(same_entry_point) < 2:
+        raise ValueError(f"Need two profiled runs of {entry_point} in {profile_dir}")
+    return same_entry_point[-2], same_entry_point[-1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare the stage breakdown of two profiled runs")
+    parser.add_argument("baseline", type=Path, nargs="?")
+    parser.add_argument("current", type=Path, nargs="?")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent")
+    args = parser.parse_args()
+
+    if args.baseline is None or args.current is None:
+        baseline_dir, current_dir = _latest_runs(Path(os.getenv("PROFILE_DIR", profiling.DEFAULT_PROFILE_DIR)))
+    else:
+        baseline_dir, current_dir = args.baseline, args.current
+    baseline, current = _load(baseline_dir), _load(current_dir)
+
+    print(f"Baseline: {baseline_dir.name}")
+    print(f"Current:  {current_dir.name}\n")
+    print(f"{'stage':<15}{'baseline (s)':>14}{'current (s)':>14}{'delta':>10}")
+
+    regressions = []
+    stages = {"total": {"wall_s": baseline["wall_s"]}} | baseline["stages"]
+    current_stages = {"total": {"wall_s": current["wall_s"]}} | current["stages"]
+    for name in dict.fromkeys([*stages, *current_stages]):
+        before = stages.get(name, {}).get("wall_s", 0.0)
+        after = current_stages.get(name, {}).get("wall_s", 0.0)
+        delta = (after - before) / before * 100 if before else float("inf") if after else 0.0
+        flagged = delta > args.threshold and after >= MIN_FLAGGED_WALL_S
+        if flagged:
+            regressions.append(name)
+        print(f"{name:<15}{before:>14.4f}{after:>14.4f}{delta:>9.1f}%{'  <-' if flagged else ''}")
+
+    if regressions:
+        print(f"\nRegressed by more than {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(profiling.run(main))
@@ -1,9 +1,12 @@
 from algokit_utils import AlgorandClient
 from algosdk import mnemonic
 
+from utils import profiling
+
 
 def main() -> int:
-    algorand_client = AlgorandClient.default_localnet()
+    with profiling.stage("client"):
+        algorand_client = AlgorandClient.default_localnet()
 
     account = algorand_client.account.random()
 
@@ -18,4 +21,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
@@ -0,0 +1,500 @@
+"""
+Open-loop load generator for the ARC-89 metadata registry.
+
+Drives a read/write/delete mix built on the `examples/*` operations at a fixed target rate, independently of how fast
+the network answers, and ends with a JSON report of achieved throughput, confirmed TPS, latency percentiles, error
+breakdown and MBR spent.
+
+Prerequisites:
+- Run `make setup` (not needed with `--backend stand-in`)
+- In testnet, CALLER_MNEMONIC's account must be funded to operate. See https://lora.algokit.io/testnet/fund.
+
+Usage:
+    python -m scripts.load_test --rps 10 --duration 60 --mix read=0.7,write=0.2,delete=0.1
+    python -m scripts.load_test --backend stand-in --rps 200 --report load_test_report.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Protocol, cast
+
+from utils import profiling
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("read", "write", "delete")
+WRITE_OPERATIONS = ("write", "delete")
+
+# AVM box MBR: flat fee per box plus a per-byte fee over name and value. Asset Metadata Boxes are named by the
+# 8-byte asset ID. The stand-in backend ignores the header bytes, so its MBR figures are a lower bound.
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+BOX_NAME_SIZE = 8
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class Backend(Protocol):
+    name: str
+
+    def create_asset(self) -> int: ...
+
+    def read(self, asset_id: int) -> None: ...
+
+    def write(self, asset_id: int, metadata_json: dict) -> None: ...
+
+    def delete(self, asset_id: int) -> None: ...
+
+    def delete_asset(self, asset_id: int) -> None: ...
+
+    def registry_min_balance(self) -> int: ...
+
+
+class AlgodBackend:
+    """Runs the `examples/*` operations against the configured network."""
+
+    name = "algod"
+
+    def __init__(self) -> None:
+        # Imported lazily so the stand-in backend runs without `make setup`
+        from algosdk.logic import get_application_address
+
+        from config import config
+        from examples.create_asa import create_asset
+        from examples.create_metadata import create_metadata
+        from examples.delete_metadata import delete_metadata
+        from examples.get_metadata import get_metadata
+        from utils import delete_asset, get_algorand_client, get_caller_signer
+
+        self.network = config.network
+        self._algorand_client = get_algorand_client()
+        self._caller = get_caller_signer()
+        self._registry_address = get_application_address(config.metadata_registry_app_id)
+        self._create_asset = create_asset
+        self._create_metadata = create_metadata
+        self._delete_metadata = delete_metadata
+        self._delete_asset = delete_asset
+        self._get_metadata = get_metadata
+
+    def create_asset(self) -> int:
+        return self._create_asset(self._algorand_client, self._caller.address).asset_id
+
+    def read(self, asset_id: int) -> None:
+        self._get_metadata(self._algorand_client, asset_id)
+
+    def write(self, asset_id: int, metadata_json: dict) -> None:
+        self._create_metadata(self._algorand_client, self._caller, asset_id, metadata_json)
+
+    def delete(self, asset_id: int) -> None:
+        self._delete_metadata(self._algorand_client, self._caller, asset_id)
+
+    def delete_asset(self, asset_id: int) -> None:
+        self._delete_asset(self._algorand_client, self._caller.address, asset_id)
+
+    def registry_min_balance(self) -> int:
+        account_info = cast(dict, self._algorand_client.client.algod.account_info(self._registry_address))
+        return int(account_info["min-balance"])
+
+
+class StandInBackend:
+    """In-memory registry with simulated latency, to exercise the harness without a network."""
+
+    name = "stand-in"
+    network = "stand-in"
+
+    def __init__(self, read_latency: float, write_latency: float) -> None:
+        self._read_latency = read_latency
+        self._write_latency = write_latency
+        self._lock = threading.Lock()
+        self._next_asset_id = 1_000
+        self._boxes: dict[int, int] = {}
+
+    def _wait(self, mean: float) -> None:
+        if mean > 0:
+            time.sleep(random.expovariate(1 / mean))
+
+    def create_asset(self) -> int:
+        self._wait(self._write_latency)
+        with self._lock:
+            self._next_asset_id += 1
+            return self._next_asset_id
+
+    def read(self, asset_id: int) -> None:
+        self._wait(self._read_latency)
+        with self._lock:
+            if asset_id not in self._boxes:
+                raise Exception(f"Metadata does not exist for asset {asset_id}")
+
+    def write(self, asset_id: int, metadata_json: dict) -> None:
+        self._wait(self._write_latency)
+        with self._lock:
+            if asset_id in self._boxes:
+                raise Exception(f"Metadata already exists for asset {asset_id}")
+            self._boxes[asset_id] = len(_encode(metadata_json))
+
+    def delete(self, asset_id: int) -> None:
+        self._wait(self._write_latency)
+        with self._lock:
+            if self._boxes.pop(asset_id, None) is None:
+                raise Exception(f"Metadata does not exist for asset {asset_id}")
+
+    def delete_asset(self, asset_id: int) -> None:
+        self._wait(self._write_latency)
+        with self._lock:
+            if asset_id in self._boxes:
+                raise Exception(f"Asset {asset_id} still has metadata")
+
+    def registry_min_balance(self) -> int:
+        with self._lock:
+            return sum(BOX_FLAT_MBR + BOX_BYTE_MBR * (BOX_NAME_SIZE + size) for size in self._boxes.values())
+
+
+class AssetPool:
+    """Tracks which pool assets hold metadata, so each operation targets an asset it can succeed on."""
+
+    def __init__(self, asset_ids: list[int]) -> None:
+        self._lock = threading.Lock()
+        self._without_metadata = list(asset_ids)
+        self._with_metadata: list[int] = []
+        self._busy: set[int] = set()
+
+    def acquire(self, operation: str, rng: random.Random) -> int | None:
+        with self._lock:
+            candidates = self._without_metadata if operation == "write" else self._with_metadata
+            idle = [asset_id for asset_id in candidates if asset_id not in self._busy]
+            if not idle:
+                return None
+            asset_id = rng.choice(idle)
+            if operation in WRITE_OPERATIONS:
+                self._busy.add(asset_id)
+            return asset_id
+
+    def snapshot(self) -> tuple[list[int], list[int]]:
+        """Return the assets (with metadata, without metadata)."""
+        with self._lock:
+            return list(self._with_metadata), list(self._without_metadata)
+
+    def release(self, operation: str, asset_id: int, succeeded: bool) -> None:
+        if operation not in WRITE_OPERATIONS:
+            return
+        with self._lock:
+            self._busy.discard(asset_id)
+            if not succeeded:
+                return
+            source, target = (
+                (self._without_metadata, self._with_metadata)
+                if operation == "write"
+                else (self._with_metadata, self._without_metadata)
+            )
+            source.remove(asset_id)
+            target.append(asset_id)
+
+
+class Recorder:
+    """Collects outcomes of the operations scheduled inside the measurement window."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {operation: [] for operation in OPERATIONS}
+        self.outcomes: dict[str, Counter[str]] = {operation: Counter() for operation in OPERATIONS}
+        self.errors: Counter[str] = Counter()
+        self.skipped: Counter[str] = Counter()
+
+    def record_skipped(self, operation: str) -> None:
+        """Count a dispatch that found no eligible asset and so never reached the backend."""
+        with self._lock:
+            self.skipped[operation] += 1
+
+    def record(self, operation: str, latency: float, error: str | None) -> None:
+        with self._lock:
+            if error is None:
+                self.latencies[operation].append(latency)
+                self.outcomes[operation]["ok"] += 1
+            else:
+                self.outcomes[operation]["error"] += 1
+                self.errors[f"{operation}:{error}"] += 1
+
+
+def _encode(metadata_json: dict) -> bytes:
+    return json.dumps(metadata_json, separators=(",", ":")).encode()
+
+
+def _make_metadata_json(size: int) -> dict:
+    """Build a metadata JSON whose compact encoding is `size` bytes long (or as close as the skeleton allows)."""
+    metadata_json = {"name": "ARC-89 load test", "padding": ""}
+    padding = max(0, size - len(_encode(metadata_json)))
+    metadata_json["padding"] = "x" * padding
+    return metadata_json
+
+
+def _parse_weights(spec: str, parse_key: Callable[[str], object], separator: str) -> dict:
+    weights = {}
+    for item in spec.split(","):
+        key, _, weight = item.partition(separator)
+        if not weight:
+            raise ValueError(f"Invalid weight '{item}', expected <key>{separator}<weight>")
+        weights[parse_key(key.strip())] = float(weight)
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError(f"Weights must be non-negative and not all zero: {spec}")
+    return weights
+
+
+def _parse_mix(spec: str) -> dict[str, float]:
+    mix = _parse_weights(spec, str, "=")
+    unknown = set(mix) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+    return mix
+
+
+def _parse_body_sizes(spec: str) -> dict[int, float]:
+    return _parse_weights(spec, int, ":")
+
+
+def _error_key(exc: Exception) -> str:
+    code = getattr(exc, "code", None)
+    return f"{type(exc).__name__}[{code}]" if code else type(exc).__name__
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    summary = {f"p{p}": ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1_000 for p in PERCENTILES}
+    summary["mean"] = sum(ordered) / len(ordered) * 1_000
+    summary["max"] = ordered[-1] * 1_000
+    return {key: round(value, 3) for key, value in summary.items()}
+
+
+class LoadTest:
+    def __init__(
+        self,
+        backend: Backend,
+        rps: float,
+        duration: float,
+        warmup: float,
+        mix: dict[str, float],
+        body_sizes: dict[int, float],
+        max_in_flight: int,
+        seed: int | None,
+    ) -> None:
+        self.backend = backend
+        self.rps = rps
+        self.duration = duration
+        self.warmup = warmup
+        self.mix = mix
+        self.body_sizes = body_sizes
+        self.max_in_flight = max_in_flight
+        self.rng = random.Random(seed)
+        self.recorder = Recorder()
+        self.pool = AssetPool([])
+
+    def prepare(self, asset_count: int, prefill: float) -> None:
+        """Create the asset pool and put metadata on a share of it, so reads and deletes have targets from the start."""
+        logger.info(f"Creating {asset_count} assets")
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            creates = [executor.submit(self.backend.create_asset) for _ in range(asset_count)]
+        asset_ids = [create.result() for create in creates if create.exception() is None]
+        # Assets created before a failure still lock MBR, they go in the pool so that teardown destroys them
+        self.pool = AssetPool(asset_ids)
+        for create in creates:
+            if (error := create.exception()) is not None:
+                logger.error(f"Created {len(asset_ids)} of {asset_count} assets")
+                raise error
+
+        prefill_ids = asset_ids[: int(asset_count * prefill)]
+        logger.info(f"Pre-filling metadata on {len(prefill_ids)} assets")
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            for asset_id in prefill_ids:
+                size = self._pick_body_size()
+                executor.submit(self._run_operation, "write", asset_id, size, None)
+
+    def teardown(self) -> None:
+        """Delete the metadata left on pool assets, then destroy the assets, releasing the MBR they lock."""
+        with_metadata, without_metadata = self.pool.snapshot()
+        logger.info(f"Tearing down: deleting metadata on {len(with_metadata)} assets")
+        failed = self._teardown_step(self.backend.delete, with_metadata)
+        deletable = without_metadata + [asset_id for asset_id in with_metadata if asset_id not in failed]
+        logger.info(f"Tearing down: destroying {len(deletable)} assets")
+        failed |= self._teardown_step(self.backend.delete_asset, deletable)
+        if failed:
+            logger.warning(f"Teardown failed for assets: {', '.join(map(str, sorted(failed)))}")
+
+    def _teardown_step(self, operation: Callable[[int], None], asset_ids: list[int]) -> set[int]:
+        """Run a teardown operation on all assets concurrently, returning the IDs it failed on."""
+
+        def attempt(asset_id: int) -> int | None:
+            try:
+                operation(asset_id)
+            except Exception as e:
+                logger.warning(f"Teardown of asset {asset_id} failed: {e}")
+                return asset_id
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            return {asset_id for asset_id in executor.map(attempt, asset_ids) if asset_id is not None}
+
+    def _pick_body_size(self) -> int:
+        return self.rng.choices(list(self.body_sizes), weights=list(self.body_sizes.values()))[0]
+
+    def _run_operation(self, operation: str, asset_id: int, size: int, scheduled: float | None) -> None:
+        error = None
+        try:
+            if operation == "read":
+                self.backend.read(asset_id)
+            elif operation == "write":
+                self.backend.write(asset_id, _make_metadata_json(size))
+            else:
+                self.backend.delete(asset_id)
+        except Exception as e:
+            error = _error_key(e)
+            logger.debug(f"{operation} on asset {asset_id} failed: {e}")
+        self.pool.release(operation, asset_id, error is None)
+        if scheduled is not None:
+            # Latency is measured from the scheduled start, so queueing behind a slow endpoint is not hidden
+            self.recorder.record(operation, time.perf_counter() - scheduled, error)
+
+    def _dispatch(self, operation: str, size: int, scheduled: float, measured: bool, rng: random.Random) -> None:
+        asset_id = self.pool.acquire(operation, rng)
+        if asset_id is None:
+            if measured:
+                self.recorder.record_skipped(operation)
+            return
+        self._run_operation(operation, asset_id, size, scheduled if measured else None)
+
+    def run(self) -> dict:
+        operations = list(self.mix)
+        weights = list(self.mix.values())
+        interval = 1 / self.rps
+        scheduled_count = 0
+
+        mbr_before = self.backend.registry_min_balance()
+        start = time.perf_counter()
+        measure_start = start + self.warmup
+        end = measure_start + self.duration
+        logger.info(f"Warming up for {self.warmup}s, then measuring for {self.duration}s at {self.rps} rps")
+
+        # Open loop: requests are issued on a fixed schedule regardless of completions
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            n = 0
+            while (scheduled := start + n * interval) < end:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                measured = scheduled >= measure_start
+                operation = self.rng.choices(operations, weights=weights)[0]
+                # Each dispatch draws from its own generator, seeded here, so `--seed` does not depend on thread timing
+                dispatch_rng = random.Random(self.rng.getrandbits(64))
+                executor.submit(self._dispatch, operation, self._pick_body_size(), scheduled, measured, dispatch_rng)
+                scheduled_count += measured
+                n += 1
+        # The schedule ends just before the window closes, so fast runs can drain before `duration` has elapsed
+        elapsed = max(self.duration, time.perf_counter() - measure_start)
+        mbr_after = self.backend.registry_min_balance()
+
+        return self._report(scheduled_count, elapsed, mbr_after - mbr_before)
+
+    def _report(self, scheduled_count: int, elapsed: float, mbr_spent: int) -> dict:
+        recorder = self.recorder
+        sent = sum(sum(outcomes.values()) for outcomes in recorder.outcomes.values())
+        succeeded = sum(outcomes["ok"] for outcomes in recorder.outcomes.values())
+        confirmed = sum(recorder.outcomes[operation]["ok"] for operation in WRITE_OPERATIONS)
+        all_latencies = [latency for latencies in recorder.latencies.values() for latency in latencies]
+        return {
+            "backend": self.backend.name,
+            "network": getattr(self.backend, "network", None),
+            "target_rps": self.rps,
+            "duration_s": self.duration,
+            "warmup_s": self.warmup,
+            "max_in_flight": self.max_in_flight,
+            "mix": self.mix,
+            "body_sizes": {str(size): weight for size, weight in self.body_sizes.items()},
+            "scheduled": scheduled_count,
+            "sent": sent,
+            "skipped": dict(recorder.skipped),
+            "elapsed_s": round(elapsed, 3),
+            "drain_s": round(max(0.0, elapsed - self.duration), 3),
+            # Rates are over the real elapsed time, so completions during the drain are not overcounted
+            "sent_rps": round(sent / elapsed, 3),
+            "achieved_rps": round(succeeded / elapsed, 3),
+            "confirmed_tps": round(confirmed / elapsed, 3),
+            "latency_ms": {
+                "all": _percentiles(all_latencies),
+                **{operation: _percentiles(recorder.latencies[operation]) for operation in OPERATIONS},
+            },
+            "operations": {operation: dict(recorder.outcomes[operation]) for operation in OPERATIONS},
+            "errors": dict(recorder.errors.most_common()),
+            "mbr_spent_micro_algo": mbr_spent,
+        }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Open-loop load test for the ARC-89 metadata registry")
+    parser.add_argument("--backend", choices=("algod", "stand-in"), default="algod")
+    parser.add_argument("--rps", type=float, default=5.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measurement window in seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Warm-up seconds, excluded from the report")
+    parser.add_argument("--mix", type=_parse_mix, default="read=0.7,write=0.2,delete=0.1")
+    parser.add_argument(
+        "--body-sizes", type=_parse_body_sizes, default="256:0.6,1024:0.3,4096:0.1", help="<bytes>:<weight>,..."
+    )
+    parser.add_argument("--assets", type=int, default=20, help="Number of ASAs created for the run")
+    parser.add_argument(
+        "--keep-assets", action="store_true", help="Skip teardown, leaving the ASAs and their metadata MBR locked"
+    )
+    parser.add_argument("--prefill", type=float, default=0.5, help="Share of assets with metadata before the run")
+    parser.add_argument("--max-in-flight", type=int, default=32, help="Upper bound on concurrent requests")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--stand-in-read-latency", type=float, default=0.01, help="Mean stand-in read latency (s)")
+    parser.add_argument("--stand-in-write-latency", type=float, default=0.05, help="Mean stand-in write latency (s)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args()
+    if args.rps <= 0 or args.duration <= 0:
+        raise ValueError("--rps and --duration must be positive")
+
+    backend: Backend = (
+        AlgodBackend()
+        if args.backend == "algod"
+        else StandInBackend(args.stand_in_read_latency, args.stand_in_write_latency)
+    )
+    load_test = LoadTest(
+        backend=backend,
+        rps=args.rps,
+        duration=args.duration,
+        warmup=args.warmup,
+        mix=args.mix,
+        body_sizes=args.body_sizes,
+        max_in_flight=args.max_in_flight,
+        seed=args.seed,
+    )
+    try:
+        load_test.prepare(args.assets, args.prefill)
+        report = json.dumps(load_test.run(), indent=2)
+    finally:
+        if not args.keep_assets:
+            load_test.teardown()
+
+    if args.report is None:
+        print(report)
+    else:
+        args.report.write_text(report + "\n")
+        logger.info(f"Report written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(profiling.run(main))
@@ -0,0 +1,262 @@
+"""
+Migrate ARC-89 metadata from one registry deployment to another.
+
+Streams Asset Metadata Boxes from the source registry and recreates them in the target registry with the same body,
+flags and `deprecated_by`, then reads them back to verify the metadata hash. Reads of the next batch run while the
+current batch is written. Progress is checkpointed after every batch, so an interrupted migration resumes where it
+stopped.
+
+Each record is created with its own `create_metadata` call, run concurrently within a batch, rather than grouped with
+other records in one atomic group: a single large body already takes most of a 16 transaction group.
+
+Prerequisites:
+- Run `make setup`
+- The CALLER is the manager of every migrated ASA, and its account is funded for the target registry MBR.
+
+Usage:
+    python -m scripts.migrate_metadata --source-app-id <app_id> [--target-app-id <app_id>] [--asset-ids 1,2,3]
+"""
+
+import argparse
+import base64
+import json
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from pathlib import Path
+from typing import cast
+
+from algokit_utils import AlgorandClient, SigningAccount
+from asa_metadata_registry import Arc90Uri, AsaMetadataRegistry, AssetMetadata, AssetMetadataRecord, MetadataSource
+from asa_metadata_registry._generated.asa_metadata_registry_client import AsaMetadataRegistryClient
+
+from config import config
+from utils import get_algorand_client, get_caller_signer, profiling
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path(__file__).resolve().parent.parent / ".migrations"
+BOX_PAGE_SIZE = 1_000
+
+# Asset Metadata Boxes are named by the 8-byte big-endian asset ID
+BOX_NAME_SIZE = 8
+
+
+@dataclass
+class Checkpoint:
+    path: Path
+    source_app_id: int
+    target_app_id: int
+    migrated: set[int] = field(default_factory=set)
+    failed: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, source_app_id: int, target_app_id: int) -> "Checkpoint":
+        checkpoint = cls(path, source_app_id, target_app_id)
+        if path.is_file():
+            state = json.loads(path.read_text())
+            if (state["source_app_id"], state["target_app_id"]) != (source_app_id, target_app_id):
+                raise ValueError(f"Checkpoint {path} belongs to a different migration")
+            checkpoint.migrated = set(state["migrated"])
+            checkpoint.failed = {int(asset_id): reason for asset_id, reason in state["failed"].items()}
+        return checkpoint
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "source_app_id": self.source_app_id,
+            "target_app_id": self.target_app_id,
+            "migrated": sorted(self.migrated),
+            "failed": {str(asset_id): reason for asset_id, reason in sorted(self.failed.items())},
+        }
+        # Write-then-rename, so an interruption never leaves a truncated checkpoint behind
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2) + "\n")
+        tmp_path.replace(self.path)
+
+
+def _box_asset_id(box: dict) -> int | None:
+    name = base64.b64decode(box["name"])
+    return int.from_bytes(name, "big") if len(name) == BOX_NAME_SIZE else None
+
+
+def iter_registry_asset_ids(algorand_client: AlgorandClient, app_id: int) -> Iterator[int]:
+    """Stream the asset IDs of a registry's metadata boxes, page by page when an indexer is available."""
+    indexer = algorand_client.client.indexer_if_present
+    if indexer is None:
+        response = cast(dict, algorand_client.client.algod.application_boxes(app_id))
+        boxes = response.get("boxes", [])
+        yield from (asset_id for box in boxes if (asset_id := _box_asset_id(box)) is not None)
+        return
+
+    next_page = None
+    while True:
+        response = indexer.application_boxes(app_id, limit=BOX_PAGE_SIZE, next_page=next_page)
+        boxes = response.get("boxes", [])
+        yield from (asset_id for box in boxes if (asset_id := _box_asset_id(box)) is not None)
+        next_page = response.get("next-token")
+        if not boxes or not next_page:
+            return
+
+
+def get_registry(algorand_client: AlgorandClient, caller: SigningAccount, app_id: int) -> AsaMetadataRegistry:
+    app_client = algorand_client.client.get_typed_app_client_by_id(
+        AsaMetadataRegistryClient,
+        app_id=app_id,
+        default_sender=caller.address,
+        default_signer=caller.signer,
+    )
+    return AsaMetadataRegistry.from_app_client(app_client, algod=algorand_client.client.algod)
+
+
+def mismatches(source: AssetMetadataRecord, target: AssetMetadataRecord) -> list[str]:
+    """List what the target record does not preserve from the source one."""
+    differences = []
+    if target.header.metadata_hash != source.header.metadata_hash:
+        differences.append("metadata hash")
+    if target.header.flags != source.header.flags:
+        differences.append("flags")
+    if target.header.deprecated_by != source.header.deprecated_by:
+        differences.append("deprecated_by")
+    return differences
+
+
+class Migration:
+    def __init__(
+        self,
+        algorand_client: AlgorandClient,
+        caller: SigningAccount,
+        checkpoint: Checkpoint,
+        dry_run: bool = False,
+    ) -> None:
+        self.algorand_client = algorand_client
+        self.caller = caller
+        self.checkpoint = checkpoint
+        self.dry_run = dry_run
+        self.source = AsaMetadataRegistry.from_algod(
+            algod=algorand_client.client.algod, app_id=checkpoint.source_app_id
+        )
+        self.target = get_registry(algorand_client, caller, checkpoint.target_app_id)
+        self.target_partial_uri = Arc90Uri(
+            netauth=config.arc90_netauth, app_id=checkpoint.target_app_id, box_name=None
+        ).to_uri()
+
+    def _read(self, registry: AsaMetadataRegistry, asset_id: int) -> AssetMetadataRecord:
+        return registry.read.get_asset_metadata(asset_id=asset_id, source=MetadataSource.BOX)
+
+    def _write(self, record: AssetMetadataRecord) -> None:
+        existence = self.target.read.arc89_check_metadata_exists(asset_id=record.asset_id, source=MetadataSource.BOX)
+        if not existence.asa_exists:
+            raise Exception(f"ASA {record.asset_id} does not exist")
+        if existence.metadata_exists:
+            # Written by an interrupted run (or by hand): only verified, never overwritten
+            logger.info(f"Metadata for asset {record.asset_id} already in target registry")
+            return
+        if record.header.is_arc89_native:
+            # The ASA URL is immutable, a native record can only move to a registry its URL already points to
+            url = self.algorand_client.asset.get_by_id(record.asset_id).url or ""
+            if not url.startswith(self.target_partial_uri):
+                raise Exception(f"arc89_native ASA URL '{url}' does not point to the target registry")
+
+        metadata = AssetMetadata.from_bytes(
+            asset_id=record.asset_id,
+            metadata_bytes=record.body.raw_bytes,
+            flags=record.header.flags,
+            deprecated_by=record.header.deprecated_by,
+            arc3_compliant=record.header.is_arc3_compliant,
+        )
+        self.target.write.create_metadata(asset_manager=self.caller, metadata=metadata)
+
+    def _verify(self, record: AssetMetadataRecord) -> None:
+        differences = mismatches(record, self._read(self.target, record.asset_id))
+        if differences:
+            raise Exception(f"Target does not preserve: {', '.join(differences)}")
+
+    def _settle(self, futures: dict[int, Future]) -> dict[int, object]:
+        """Wait for one future per asset, recording failures in the checkpoint and returning the successful results."""
+        results = {}
+        for asset_id, future in futures.items():
+            try:
+                results[asset_id] = future.result()
+            except Exception as e:
+                logger.warning(f"Asset {asset_id}: {e}")
+                self.checkpoint.failed[asset_id] = str(e)
+        return results
+
+    def run(self, asset_ids: Iterable[int], batch_size: int, read_workers: int, write_workers: int) -> None:
+        pending = (asset_id for asset_id in asset_ids if asset_id not in self.checkpoint.migrated)
+        batches = batched(pending, batch_size, strict=False)
+
+        with ThreadPoolExecutor(read_workers) as readers, ThreadPoolExecutor(write_workers) as writers:
+
+            def submit_reads(batch: tuple[int, ...]) -> dict[int, Future]:
+                return {asset_id: readers.submit(self._read, self.source, asset_id) for asset_id in batch}
+
+            next_reads = submit_reads(next(batches, ()))
+            while next_reads:
+                # Prefetch the next batch from the source while this one is written to the target
+                current_reads, next_reads = next_reads, submit_reads(next(batches, ()))
+                for asset_id in current_reads:
+                    self.checkpoint.failed.pop(asset_id, None)
+                records = cast(dict[int, AssetMetadataRecord], self._settle(current_reads))
+                if not self.dry_run:
+                    self._settle({asset_id: writers.submit(self._write, r) for asset_id, r in records.items()})
+                    written = {asset_id: r for asset_id, r in records.items() if asset_id not in self.checkpoint.failed}
+                    verified = self._settle(
+                        {asset_id: readers.submit(self._verify, r) for asset_id, r in written.items()}
+                    )
+                    self.checkpoint.migrated.update(verified)
+                    self.checkpoint.save()
+                logger.info(
+                    f"Batch done: {len(records)} read, {len(self.checkpoint.migrated)} migrated in total, "
+                    f"{len(self.checkpoint.failed)} failed"
+                )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Migrate ARC-89 metadata between registry deployments")
+    parser.add_argument("--source-app-id", type=int, required=True)
+    parser.add_argument("--target-app-id", type=int, default=None, help="Defaults to the configured registry")
+    parser.add_argument("--asset-ids", type=str, default=None, help="Comma-separated subset to migrate")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--read-workers", type=int, default=8)
+    parser.add_argument("--write-workers", type=int, default=4)
+    parser.add_argument("--checkpoint", type=Path, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="Only read the source records")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Migrate metadata between registry deployments on the configured network."""
+    args = _parse_args()
+    target_app_id = args.target_app_id or config.metadata_registry_app_id
+    if target_app_id == args.source_app_id:
+        raise ValueError("Source and target registries must differ")
+
+    checkpoint_path = args.checkpoint or DEFAULT_CHECKPOINT_DIR / f"{args.source_app_id}-to-{target_app_id}.json"
+    checkpoint = Checkpoint.load(checkpoint_path, args.source_app_id, target_app_id)
+    algorand_client = get_algorand_client()
+    migration = Migration(algorand_client, get_caller_signer(), checkpoint, dry_run=args.dry_run)
+
+    asset_ids: Iterable[int] = (
+        [int(asset_id) for asset_id in args.asset_ids.split(",")]
+        if args.asset_ids
+        else iter_registry_asset_ids(algorand_client, args.source_app_id)
+    )
+
+    started = time.perf_counter()
+    migration.run(asset_ids, args.batch_size, args.read_workers, args.write_workers)
+    elapsed = time.perf_counter() - started
+
+    logger.info(f"Source registry: {args.source_app_id} -> target registry: {target_app_id}")
+    logger.info(f"Migrated: {len(checkpoint.migrated)}, failed: {len(checkpoint.failed)} ({elapsed:.1f}s)")
+    if not args.dry_run:
+        logger.info(f"Checkpoint: {checkpoint_path}")
+    return 1 if checkpoint.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(profiling.run(main))
@@ -3,10 +3,12 @@ from pathlib import Path
 
 from dotenv import set_key
 
+from utils import profiling
+
 
 def main() -> int:
     if len(sys.argv) != 2 or sys.argv[1] not in {"localnet", "testnet"}:
-        print("Usage: python scripts/switch_network.py <localnet|testnet>")
+        print("Usage: python -m scripts.switch_network <localnet|testnet>")
         return 1
 
     network = sys.argv[1]
@@ -18,4 +20,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(profiling.run(main))
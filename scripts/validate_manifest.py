@@ -0,0 +1,115 @@
+"""
+Pre-validate a metadata manifest before submitting anything.
+
+Checks every entry against the rules the registry enforces on creation (ASA existence, no existing metadata, sender is
+the ASA manager, body size, ARC-89 native URL prefix, ARC-3 conventions) plus the SDK's own metadata checks. ASA
+params and registry state are fetched once per asset up front, then entries are validated in parallel across cores.
+
+The manifest is a JSON list of entries:
+
+    [
+      {
+        "asset_id": 1234,
+        "metadata": {"name": "..."},
+        "flags": {"arc20": false, "arc62": false, "arc3": false, "arc89_native": true, "immutable": false},
+        "deprecated_by": 0
+      }
+    ]
+
+Prerequisites:
+- Run `make setup`
+
+Usage:
+    python -m scripts.validate_manifest manifest.json [--sender <address>] [--output rejected.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from algokit_utils import AlgorandClient
+from asa_metadata_registry import Arc90Uri, AsaMetadataRegistry, MetadataSource
+
+from config import config
+from utils import get_algorand_client, get_caller_address, profiling
+from utils.validation import MAX_METADATA_SIZE, AssetState, ValidationContext, is_asset_id, validate_manifest
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_asset_states(algorand_client: AlgorandClient, asset_ids: set[int], workers: int) -> dict[int, AssetState]:
+    """Fetch ASA params and metadata existence for all assets in a single concurrent pass."""
+    registry_readonly = AsaMetadataRegistry.from_algod(
+        algod=algorand_client.client.algod,
+        app_id=config.metadata_registry_app_id,
+    )
+
+    def fetch(asset_id: int) -> AssetState:
+        try:
+            return fetch_one(asset_id)
+        except Exception as e:
+            # One unreachable or malformed asset must not abort the whole run, it is reported as a rejection
+            logger.warning(f"Asset {asset_id}: {e}")
+            return AssetState(asset_id=asset_id, asa_exists=False, error=str(e))
+
+    def fetch_one(asset_id: int) -> AssetState:
+        existence = registry_readonly.read.arc89_check_metadata_exists(asset_id=asset_id, source=MetadataSource.BOX)
+        if not existence.asa_exists:
+            return AssetState(asset_id=asset_id, asa_exists=False)
+        asset = algorand_client.asset.get_by_id(asset_id)
+        return AssetState(
+            asset_id=asset_id,
+            asa_exists=True,
+            metadata_exists=existence.metadata_exists,
+            manager=asset.manager,
+            asset_name=asset.asset_name,
+            url=asset.url,
+        )
+
+    with ThreadPoolExecutor(workers) as executor:
+        return {state.asset_id: state for state in executor.map(fetch, sorted(asset_ids))}
+
+
+def main() -> int:
+    """Validate a metadata manifest against the configured network."""
+    parser = argparse.ArgumentParser(description="Pre-validate a metadata manifest before submission")
+    parser.add_argument("manifest", type=Path)
+    parser.add_argument("--sender", type=str, default=None, help="Defaults to the CALLER_MNEMONIC address")
+    parser.add_argument("--max-body-size", type=int, default=MAX_METADATA_SIZE)
+    parser.add_argument("--fetch-workers", type=int, default=16, help="Concurrent ASA param fetches")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Validation processes")
+    parser.add_argument("--output", type=Path, default=None, help="Write the rejections here instead of stdout")
+    args = parser.parse_args()
+
+    entries = json.loads(args.manifest.read_text())
+    if not isinstance(entries, list):
+        raise ValueError(f"{args.manifest} must contain a JSON list of entries")
+
+    context = ValidationContext(
+        sender=args.sender or get_caller_address(),
+        arc90_partial_uri=Arc90Uri(
+            netauth=config.arc90_netauth, app_id=config.metadata_registry_app_id, box_name=None
+        ).to_uri(),
+        max_body_size=args.max_body_size,
+    )
+    asset_ids = {
+        entry["asset_id"] for entry in entries if isinstance(entry, dict) and is_asset_id(entry.get("asset_id"))
+    }
+    states = fetch_asset_states(get_algorand_client(), asset_ids, args.fetch_workers)
+    rejections = validate_manifest(entries, states, context, workers=args.workers)
+
+    report = json.dumps({"checked": len(entries), "rejected": [asdict(r) for r in rejections]}, indent=2)
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report + "\n")
+    logger.info(f"Checked {len(entries)} entries, {len(rejections)} rejected")
+    return 1 if rejections else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(profiling.run(main))
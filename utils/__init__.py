@@ -1,3 +1,4 @@
+from utils import profiling  # Imported first so profiled runs also measure the imports below
 from utils.runtime import (
     get_algorand_client,
     get_caller_address,
@@ -11,6 +12,7 @@ from utils.utils import (
 )
 
 __all__ = [
+    "profiling",
     "get_algorand_client",
     "get_caller_address",
     "get_caller_signer",
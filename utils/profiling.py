@@ -0,0 +1,236 @@
+"""
+Opt-in profiling for the entry points, enabled with `--profile` or `PROFILE=1`.
+
+Imported first by the `utils`, `examples` and `scripts` packages and by `config.py`, so a profiled run starts measuring
+before the heavy third-party imports. Each run writes to its own directory under `PROFILE_DIR` (default `.profiles/`):
+
+- `cpu.prof` / `cpu.txt`: cProfile CPU profile (pstats dump and its top functions by cumulative time)
+- `wall.folded`: wall-clock stacks of all threads from a sampling profiler, in collapsed-stack format for flame graphs
+- `stages.json`: wall and CPU time per stage (import, config, client, signing, serialization, network, main). Waits in
+  the traffic wrapper (rate limit, concurrency, retry backoff) count as `network`
+
+Stage times are exclusive (a stage nested in another is not counted twice) and summed over threads. `main` is the
+time spent in `main()` outside every other stage.
+"""
+
+import cProfile
+import importlib
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PROFILE_DIR = PROJECT_ROOT / ".profiles"
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# (module, class or None, function, stage): library calls attributed to a stage while profiling
+INSTRUMENTED_CALLS = (
+    ("algosdk.transaction", "Transaction", "_raw_sign", "signing"),
+    ("algosdk.encoding", None, "msgpack_encode", "serialization"),
+    ("algosdk.encoding", None, "msgpack_decode", "serialization"),
+    ("algosdk.v2client.algod", "AlgodClient", "algod_request", "network"),
+    ("algosdk.v2client.indexer", "IndexerClient", "indexer_request", "network"),
+)
+
+
+def _profiling_requested() -> bool:
+    """Check the PROFILE env variable and consume a `--profile` argument, so entry points never see it."""
+    requested = os.getenv("PROFILE", "").lower() in ("1", "true", "yes")
+    if "--profile" in sys.argv:
+        sys.argv.remove("--profile")
+        requested = True
+    return requested
+
+
+@dataclass
+class _Frame:
+    name: str
+    wall_start: float
+    cpu_start: float
+    child_wall: float = 0.0
+    child_cpu: float = 0.0
+
+
+class _StageTimer:
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.wall: defaultdict[str, float] = defaultdict(float)
+        self.cpu: defaultdict[str, float] = defaultdict(float)
+        self.calls: Counter[str] = Counter()
+
+    def _stack(self) -> list[_Frame]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        stack: list[_Frame] = self._local.stack
+        return stack
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        frame = _Frame(name, time.perf_counter(), time.thread_time())
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall = time.perf_counter() - frame.wall_start
+            cpu = time.thread_time() - frame.cpu_start
+            with self._lock:
+                self.wall[name] += wall - frame.child_wall
+                self.cpu[name] += cpu - frame.child_cpu
+                self.calls[name] += 1
+            if stack:
+                stack[-1].child_wall += wall
+                stack[-1].child_cpu += cpu
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "wall_s": round(self.wall[name], 6),
+                    "cpu_s": round(self.cpu[name], 6),
+                    "calls": self.calls[name],
+                }
+                for name in sorted(self.wall, key=self.wall.__getitem__, reverse=True)
+            }
+
+
+class _Sampler(threading.Thread):
+    """Samples the stacks of all threads at a fixed interval, so time blocked on I/O shows up too."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="profiling-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> list[str]:
+        names = []
+        while frame is not None:
+            names.append(f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}")
+            frame = frame.f_back
+        return names[::-1]
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == self.ident:
+                    continue
+                stack = [f"thread:{thread_names.get(ident, ident)}", *self._collapse(frame)]
+                self.stacks[";".join(stack)] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.started_at = datetime.now(UTC)
+        self.stages = _StageTimer()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.cpu_profile = cProfile.Profile(time.process_time)
+        self.sampler = _Sampler(float(os.getenv("PROFILE_SAMPLE_INTERVAL", DEFAULT_SAMPLE_INTERVAL)))
+        self._import_stage = self.stages.measure("import")
+
+    def start(self) -> None:
+        self._import_stage.__enter__()
+        self.sampler.start()
+        self.cpu_profile.enable()
+
+    def _instrument(self) -> None:
+        # Only modules already imported by the entry point are patched, profiling must not add imports of its own
+        for module_name, class_name, function_name, stage_name in INSTRUMENTED_CALLS:
+            if module_name not in sys.modules:
+                continue
+            module = importlib.import_module(module_name)
+            owner = getattr(module, class_name) if class_name else module
+            setattr(owner, function_name, self._timed(getattr(owner, function_name), stage_name))
+
+    def _timed(self, function: Callable[..., Any], stage_name: str) -> Callable[..., Any]:
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stages.measure(stage_name):
+                return function(*args, **kwargs)
+
+        return timed
+
+    def run(self, main: Callable[[], int]) -> int:
+        self._import_stage.__exit__(None, None, None)
+        self._instrument()
+        exit_code = 1
+        try:
+            with self.stages.measure("main"):
+                exit_code = main()
+            return exit_code
+        finally:
+            self.cpu_profile.disable()
+            self.sampler.stop()
+            self._write_artifacts(exit_code)
+
+    def _write_artifacts(self, exit_code: int) -> None:
+        entry_point = Path(sys.argv[0]).stem
+        profile_dir = Path(os.getenv("PROFILE_DIR", DEFAULT_PROFILE_DIR))
+        run_dir = profile_dir / f"{self.started_at:%Y%m%d-%H%M%S}-{entry_point}-{os.getpid()}"
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        self.cpu_profile.dump_stats(run_dir / "cpu.prof")
+        report = io.StringIO()
+        pstats.Stats(self.cpu_profile, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+        (run_dir / "cpu.txt").write_text(report.getvalue())
+
+        (run_dir / "wall.folded").write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.sampler.stacks.most_common())
+        )
+
+        summary = {
+            "entry_point": entry_point,
+            "argv": sys.argv[1:],
+            "network": os.getenv("NETWORK"),
+            "started_at": self.started_at.isoformat(),
+            "exit_code": exit_code,
+            "wall_s": round(time.perf_counter() - self.wall_start, 6),
+            "cpu_s": round(time.process_time() - self.cpu_start, 6),
+            "stages": self.stages.summary(),
+        }
+        (run_dir / "stages.json").write_text(json.dumps(summary, indent=2) + "\n")
+        print(f"Profile written to {run_dir}", file=sys.stderr)
+
+
+_session: _Session | None = None
+if _profiling_requested():
+    _session = _Session()
+    _session.start()
+
+
+def enabled() -> bool:
+    return _session is not None
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Attribute the enclosed block to stage `name` in profiled runs; a no-op otherwise."""
+    if _session is None:
+        return nullcontext()
+    return _session.stages.measure(name)
+
+
+def run(main: Callable[[], int]) -> int:
+    """Run an entry point's `main()`, profiling it and writing the run's artifacts when profiling is enabled."""
+    if _session is None:
+        return main()
+    return _session.run(main)
@@ -3,6 +3,9 @@ import os
 from algokit_utils import AlgorandClient, SigningAccount
 from algosdk import account, mnemonic
 
+from utils import profiling
+from utils.traffic import install_traffic_control, traffic_control_enabled
+
 # Singleton Algorand client
 algorand_client = None
 
@@ -13,8 +16,11 @@ _signer_configured = False
 def get_algorand_client() -> AlgorandClient:
     global algorand_client
     if algorand_client is None:
-        algorand_client = AlgorandClient.from_environment()
-        _ensure_signer_configured()
+        with profiling.stage("client"):
+            algorand_client = AlgorandClient.from_environment()
+            if traffic_control_enabled():
+                install_traffic_control(algorand_client)
+            _ensure_signer_configured()
     return algorand_client
 
 
@@ -22,8 +28,10 @@ def get_caller_address() -> str:
     caller_mnemonic = os.getenv("CALLER_MNEMONIC")
     if not caller_mnemonic:
         raise ValueError("CALLER_MNEMONIC environment variable is not set")
-    private_key = mnemonic.to_private_key(caller_mnemonic)
-    address: str = account.address_from_private_key(private_key)
+    # Key derivation from the configured mnemonic counts as configuration, `signing` is transaction signing only
+    with profiling.stage("config"):
+        private_key = mnemonic.to_private_key(caller_mnemonic)
+        address: str = account.address_from_private_key(private_key)
     return address
 
 
@@ -31,8 +39,9 @@ def get_caller_signer() -> SigningAccount:
     caller_mnemonic = os.getenv("CALLER_MNEMONIC")
     if not caller_mnemonic:
         raise ValueError("CALLER_MNEMONIC environment variable is not set")
-    private_key = mnemonic.to_private_key(caller_mnemonic)
-    return SigningAccount(address=account.address_from_private_key(private_key), private_key=private_key)
+    with profiling.stage("config"):
+        private_key = mnemonic.to_private_key(caller_mnemonic)
+        return SigningAccount(address=account.address_from_private_key(private_key), private_key=private_key)
 
 
 def _ensure_signer_configured() -> None:
@@ -9,6 +9,8 @@ from asa_metadata_registry import constants as registry_constants
 from asa_metadata_registry._generated.asa_metadata_registry_client import AsaMetadataRegistryFactory
 from dotenv import load_dotenv, set_key
 
+from utils import profiling
+
 logger = logging.getLogger(__name__)
 
 LOCALNET_NETAUTH = "net:localnet"
@@ -23,10 +25,11 @@ def get_network() -> str:
 
 
 def load_env_files(project_root: Path) -> tuple[str, Path]:
-    load_dotenv(dotenv_path=project_root / ".env")
-    network = get_network()
-    env_path = project_root / f".env.{network}"
-    load_dotenv(dotenv_path=env_path)
+    with profiling.stage("config"):
+        load_dotenv(dotenv_path=project_root / ".env")
+        network = get_network()
+        env_path = project_root / f".env.{network}"
+        load_dotenv(dotenv_path=env_path)
     return network, env_path
 
 
@@ -123,7 +126,8 @@ def main() -> int:
     """
     logging.basicConfig(level=logging.INFO, format="%(message)s")
     network, env_path = load_env_files(Path(__file__).resolve().parent.parent)
-    algorand = AlgorandClient.from_environment()
+    with profiling.stage("client"):
+        algorand = AlgorandClient.from_environment()
     logger.info("Network: %s", network)
     caller_mnemonic = _ensure_caller_mnemonic(algorand, env_path, network)
 
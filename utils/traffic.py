@@ -0,0 +1,298 @@
+import io
+import logging
+import os
+import random
+import threading
+import time
+import urllib.error
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import msgpack
+from algokit_utils import AlgorandClient
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+from algosdk.transaction import SignedTransaction
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from utils import profiling
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+TRANSIENT_ERRORS = (urllib.error.URLError, TimeoutError, ConnectionError)
+
+# Long-polling endpoints are slow by design and must not be read as a congestion signal
+LONG_POLL_PREFIXES = ("/status/wait-for-block-after/",)
+
+
+@dataclass
+class TrafficSettings:
+    rate_limit: float = 50.0
+    burst: int = 10
+    initial_concurrency: int = 4
+    max_concurrency: int = 64
+    latency_target: float = 2.0
+    max_retries: int = 5
+    backoff_base: float = 0.25
+    backoff_cap: float = 8.0
+
+    @classmethod
+    def from_environment(cls) -> "TrafficSettings":
+        defaults = cls()
+        return cls(
+            rate_limit=float(os.getenv("TRAFFIC_RATE_LIMIT", defaults.rate_limit)),
+            burst=int(os.getenv("TRAFFIC_BURST", defaults.burst)),
+            initial_concurrency=int(os.getenv("TRAFFIC_INITIAL_CONCURRENCY", defaults.initial_concurrency)),
+            max_concurrency=int(os.getenv("TRAFFIC_MAX_CONCURRENCY", defaults.max_concurrency)),
+            latency_target=float(os.getenv("TRAFFIC_LATENCY_TARGET", defaults.latency_target)),
+            max_retries=int(os.getenv("TRAFFIC_MAX_RETRIES", defaults.max_retries)),
+        )
+
+
+def traffic_control_enabled() -> bool:
+    return os.getenv("TRAFFIC_CONTROL", "").lower() in ("1", "true", "yes")
+
+
+class TokenBucket:
+    """Caps the request rate at `rate` per second, allowing bursts of up to `burst` requests."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AimdLimiter:
+    """
+    Adaptive concurrency limit: additive increase on healthy responses, multiplicative decrease on congestion.
+
+    The limit grows by one per window of successful requests and halves on a 429/5xx, a timeout or a response slower
+    than `latency_target`. Decreases are spaced by `latency_target` so a burst of failures from requests that were
+    already in flight counts as a single congestion event.
+    """
+
+    def __init__(self, initial: int, maximum: int, latency_target: float, decrease_factor: float = 0.5) -> None:
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self, latency: float | None) -> None:
+        if latency is not None and latency > self.latency_target:
+            self.on_congestion()
+            return
+        with self._condition:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def on_congestion(self) -> None:
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.latency_target:
+                return
+            self._last_decrease = now
+            self.limit = max(1.0, self.limit * self.decrease_factor)
+            logger.debug("Congestion detected, concurrency limit lowered to %.1f", self.limit)
+
+
+def _http_error(exc: BaseException) -> urllib.error.HTTPError | None:
+    """
+    Find the urllib HTTPError behind an algosdk HTTP error.
+
+    The algod and indexer clients raise their own error while handling the HTTPError, which keeps the status and
+    headers they drop, so it is still reachable through the exception context chain.
+    """
+    context: BaseException | None = exc
+    while context is not None:
+        if isinstance(context, urllib.error.HTTPError):
+            return context
+        context = context.__context__
+    return None
+
+
+def _status_code(exc: Exception) -> int | None:
+    if isinstance(exc, AlgodHTTPError):
+        code: int | None = exc.code
+        return code
+    if isinstance(exc, IndexerHTTPError):
+        http_error = _http_error(exc)
+        return http_error.code if http_error is not None else None
+    return None
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Seconds to wait before retrying as asked by a 429 response's `Retry-After` header, None if absent."""
+    http_error = _http_error(exc)
+    if http_error is None or http_error.code != 429 or http_error.headers is None:
+        return None
+    value = http_error.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Either delay-seconds or an HTTP date
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _already_in_ledger(exc: Exception) -> bool:
+    return isinstance(exc, AlgodHTTPError) and exc.code == 400 and "already in ledger" in str(exc)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    return isinstance(exc, TRANSIENT_ERRORS) or _status_code(exc) in RETRYABLE_STATUS_CODES
+
+
+def _transaction_ids(data: bytes) -> list[str]:
+    """Decode the transaction IDs of a raw (possibly grouped) signed transaction submission."""
+    return [SignedTransaction.undictify(stxn).get_txid() for stxn in msgpack.Unpacker(io.BytesIO(data), raw=False)]
+
+
+class TrafficController:
+    """
+    Wraps an algod or indexer client so every request goes through a token bucket, an AIMD concurrency limit and
+    jittered exponential backoff retries.
+
+    Reads are retried freely. Transaction submissions are only resubmitted after checking, by transaction ID, that the
+    node does not already know about them, so a submission whose response was lost is never sent twice. A resend
+    rejected as already in ledger means the first submission was committed, and is reported as a success.
+    """
+
+    def __init__(self, name: str, settings: TrafficSettings) -> None:
+        self.name = name
+        self.settings = settings
+        self.bucket = TokenBucket(settings.rate_limit, settings.burst)
+        self.limiter = AimdLimiter(settings.initial_concurrency, settings.max_concurrency, settings.latency_target)
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: spreads retries of concurrent callers instead of synchronising them
+        return random.uniform(0, min(self.settings.backoff_cap, self.settings.backoff_base * 2**attempt))
+
+    def _send(self, request: Callable[..., Any], method: str, requrl: str, *args: Any, **kwargs: Any) -> Any:
+        self.bucket.acquire()
+        # Long polls hold their connection for up to a round by design, they must not starve other requests of slots
+        long_poll = requrl.startswith(LONG_POLL_PREFIXES)
+        with nullcontext() if long_poll else self.limiter.slot():
+            started = time.perf_counter()
+            try:
+                response = request(method, requrl, *args, **kwargs)
+            except Exception as e:
+                if _is_retryable(e):
+                    self.limiter.on_congestion()
+                raise
+            latency = None if long_poll else time.perf_counter() - started
+            self.limiter.on_success(latency)
+            return response
+
+    def _already_submitted(self, algod: AlgodClient, data: bytes) -> str | None:
+        """Return the group's first transaction ID if the node already accepted it, None if it must be resubmitted."""
+        tx_ids = _transaction_ids(data)
+        try:
+            pending = algod.pending_transaction_info(tx_ids[0])
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        if isinstance(pending, dict) and pending.get("pool-error"):
+            return None
+        return tx_ids[0]
+
+    def wrap(self, request: Callable[..., Any], algod: AlgodClient | None = None) -> Callable[..., Any]:
+        def controlled_request(method: str, requrl: str, *args: Any, **kwargs: Any) -> Any:
+            # Rate limit, concurrency slot and backoff waits are network wait too, not time spent in main()
+            with profiling.stage("network"):
+                return send_with_retries(method, requrl, *args, **kwargs)
+
+        def send_with_retries(method: str, requrl: str, *args: Any, **kwargs: Any) -> Any:
+            is_submission = algod is not None and method == "POST" and requrl == "/transactions"
+            resubmitted = False
+            attempt = 0
+            while True:
+                try:
+                    return self._send(request, method, requrl, *args, **kwargs)
+                except Exception as e:
+                    if resubmitted and _already_in_ledger(e):
+                        # The earlier submission was committed and left the pending pool before it could be checked
+                        committed_tx_id = _transaction_ids(kwargs["data"])[0]
+                        logger.info("%s transaction %s already in ledger", self.name, committed_tx_id)
+                        return {"txId": committed_tx_id}
+                    if not _is_retryable(e) or attempt >= self.settings.max_retries:
+                        raise
+                    retry_after = _retry_after(e)
+                    delay = self._backoff(attempt) if retry_after is None else retry_after
+                    attempt += 1
+                    logger.info("%s %s %s failed (%r), retry %d in %.2fs", self.name, method, requrl, e, attempt, delay)
+                    time.sleep(delay)
+                if is_submission and algod is not None:
+                    tx_id = self._already_submitted(algod, kwargs["data"])
+                    if tx_id is not None:
+                        logger.info("%s transaction %s already submitted, not resending", self.name, tx_id)
+                        return {"txId": tx_id}
+                    resubmitted = True
+
+        return controlled_request
+
+
+def install_traffic_control(algorand_client: AlgorandClient, settings: TrafficSettings | None = None) -> None:
+    """
+    Route all algod and indexer requests of `algorand_client` through their own TrafficController.
+
+    The clients are patched in place, since the AlgorandClient managers hold references to these same instances.
+    """
+    if settings is None:
+        settings = TrafficSettings.from_environment()
+
+    algod = algorand_client.client.algod
+    algod_controller = TrafficController("algod", settings)
+    algod.algod_request = algod_controller.wrap(algod.algod_request, algod)  # type: ignore[method-assign]
+
+    indexer: IndexerClient | None = algorand_client.client.indexer_if_present
+    if indexer is not None:
+        indexer_controller = TrafficController("indexer", settings)
+        indexer.indexer_request = indexer_controller.wrap(indexer.indexer_request)  # type: ignore[method-assign]
+
+    logger.info(
+        "Traffic control enabled (rate limit %s rps, concurrency %s-%s)",
+        settings.rate_limit,
+        settings.initial_concurrency,
+        settings.max_concurrency,
+    )
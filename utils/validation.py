@@ -0,0 +1,192 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from algosdk.constants import ZERO_ADDRESS
+from asa_metadata_registry import (
+    AssetMetadata,
+    IrreversibleFlags,
+    MetadataFlags,
+    ReversibleFlags,
+    is_arc3_metadata,
+)
+from asa_metadata_registry import constants as registry_constants
+
+# Largest metadata body the registry accepts: the AVM box size limit minus the Asset Metadata header
+MAX_METADATA_SIZE: int = registry_constants.MAX_METADATA_SIZE
+
+REVERSIBLE_FLAGS = ("arc20", "arc62")
+IRREVERSIBLE_FLAGS = ("arc3", "arc89_native", "immutable")
+
+ARC3_FRAGMENT = "arc3"
+ARC3_NAME_SUFFIX = "@arc3"
+
+
+@dataclass(frozen=True)
+class AssetState:
+    """The ASA params and registry state a manifest entry is checked against, fetched once per asset."""
+
+    asset_id: int
+    asa_exists: bool
+    metadata_exists: bool = False
+    manager: str | None = None
+    asset_name: str | None = None
+    url: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ValidationContext:
+    sender: str
+    # Registry partial URI without compliance fragment, e.g. `algorand://<netauth>/app/<id>?box=`
+    arc90_partial_uri: str
+    max_body_size: int = MAX_METADATA_SIZE
+
+
+@dataclass(frozen=True)
+class Rejection:
+    index: int
+    asset_id: int | None
+    reasons: list[str]
+
+
+def _metadata_flags(flags: dict) -> MetadataFlags:
+    return MetadataFlags(
+        reversible=ReversibleFlags(**{name: flags.get(name, False) for name in REVERSIBLE_FLAGS}),
+        irreversible=IrreversibleFlags(**{name: flags.get(name, False) for name in IRREVERSIBLE_FLAGS}),
+    )
+
+
+def is_asset_id(value: object) -> bool:
+    """Check a manifest `asset_id` is a positive integer (JSON booleans parse as ints, they are not)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _check_shape(entry: dict) -> list[str]:
+    if not isinstance(entry, dict):
+        return ["entry must be a JSON object"]
+    reasons = []
+    if not is_asset_id(entry.get("asset_id")):
+        reasons.append("asset_id must be a positive integer")
+    if not isinstance(entry.get("metadata"), dict):
+        reasons.append("metadata must be a JSON object")
+    flags = entry.get("flags", {})
+    if not isinstance(flags, dict):
+        reasons.append("flags must be an object")
+    else:
+        unknown = set(flags) - {*REVERSIBLE_FLAGS, *IRREVERSIBLE_FLAGS}
+        if unknown:
+            reasons.append(f"unknown flags: {', '.join(sorted(unknown))}")
+        # No truthiness coercion: a string "false" must not silently set an irreversible flag
+        not_boolean = [name for name, value in flags.items() if not isinstance(value, bool)]
+        if not_boolean:
+            reasons.append(f"flags must be true or false: {', '.join(sorted(not_boolean))}")
+    deprecated_by = entry.get("deprecated_by", 0)
+    if not isinstance(deprecated_by, int) or isinstance(deprecated_by, bool) or deprecated_by < 0:
+        reasons.append("deprecated_by must be a non-negative integer")
+    return reasons
+
+
+def _check_asset(state: AssetState, context: ValidationContext) -> list[str]:
+    if state.error is not None:
+        return [f"could not fetch ASA {state.asset_id}: {state.error}"]
+    if not state.asa_exists:
+        return [f"ASA {state.asset_id} does not exist"]
+    reasons = []
+    if state.metadata_exists:
+        reasons.append(f"metadata already exists for asset {state.asset_id}")
+    if state.manager is None or state.manager == ZERO_ADDRESS:
+        reasons.append("ASA has no manager, its metadata is immutable")
+    elif state.manager != context.sender:
+        reasons.append(f"sender {context.sender} is not the ASA manager ({state.manager})")
+    return reasons
+
+
+def _check_url(flags: dict, metadata: dict, state: AssetState, context: ValidationContext) -> list[str]:
+    reasons = []
+    url = state.url or ""
+    is_arc90_url = url.startswith(context.arc90_partial_uri)
+    fragment = url.partition("#")[2] if is_arc90_url else ""
+
+    if flags.get("arc89_native") and not is_arc90_url:
+        reasons.append(f"arc89_native requires the ASA URL to start with {context.arc90_partial_uri}, got '{url}'")
+
+    # An ARC-90 compliance fragment declaring ARC-3 must not declare any other ARC
+    if fragment.startswith("arc") and "3" in fragment.removeprefix("arc").split("+"):
+        if fragment != ARC3_FRAGMENT:
+            reasons.append(f"ARC-3 compliance fragment must be exactly #arc3, got #{fragment}")
+
+    if flags.get("arc3"):
+        if not is_arc3_metadata(metadata):
+            reasons.append("arc3 flag set but metadata is not ARC-3 metadata")
+        asset_name = state.asset_name or ""
+        if is_arc90_url:
+            if fragment != ARC3_FRAGMENT:
+                reasons.append("arc3 flag set but the ASA URL fragment is not #arc3")
+        elif not (asset_name == ARC3_FRAGMENT or asset_name.endswith(ARC3_NAME_SUFFIX) or url.endswith("#arc3")):
+            reasons.append("arc3 flag set but neither the ASA name nor URL follow the ARC-3 convention")
+    return reasons
+
+
+def validate_entry(entry: dict, state: AssetState | None, context: ValidationContext) -> list[str]:
+    """Return the reasons a manifest entry would be rejected on submission, empty if it passes."""
+    reasons = _check_shape(entry)
+    if reasons:
+        return reasons
+    if state is None:
+        return [f"no ASA params fetched for asset {entry['asset_id']}"]
+
+    metadata: dict = entry["metadata"]
+    flags: dict = entry.get("flags", {})
+    reasons += _check_asset(state, context)
+
+    body_size = len(json.dumps(metadata, separators=(",", ":")).encode())
+    if body_size > context.max_body_size:
+        reasons.append(f"metadata body is {body_size} bytes, above the {context.max_body_size} byte limit")
+
+    reasons += _check_url(flags, metadata, state, context)
+
+    # Let the SDK run its own checks (encoding, size, flag consistency) the same way create_metadata would
+    try:
+        AssetMetadata.from_json(
+            asset_id=entry["asset_id"],
+            json_obj=metadata,
+            flags=_metadata_flags(flags),
+            deprecated_by=entry.get("deprecated_by", 0),
+            arc3_compliant=is_arc3_metadata(metadata),
+        )
+    except Exception as e:
+        reasons.append(f"invalid metadata: {e}")
+    return reasons
+
+
+def _validate_chunk(chunk: list[tuple[int, dict, AssetState | None]], context: ValidationContext) -> list[Rejection]:
+    rejections = []
+    for index, entry, state in chunk:
+        reasons = validate_entry(entry, state, context)
+        if reasons:
+            asset_id = entry.get("asset_id") if isinstance(entry, dict) else None
+            rejections.append(Rejection(index, asset_id if is_asset_id(asset_id) else None, reasons))
+    return rejections
+
+
+def validate_manifest(
+    entries: list[dict], states: dict[int, AssetState], context: ValidationContext, workers: int = 1
+) -> list[Rejection]:
+    """Validate all manifest entries, spread over `workers` processes, and return the rejected ones in order."""
+    items = [
+        (
+            index,
+            entry,
+            states.get(entry["asset_id"]) if isinstance(entry, dict) and is_asset_id(entry.get("asset_id")) else None,
+        )
+        for index, entry in enumerate(entries)
+    ]
+    if workers <= 1 or len(items) <= 1:
+        return _validate_chunk(items, context)
+
+    chunk_size = -(-len(items) // workers)
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(workers) as executor:
+        results = executor.map(_validate_chunk, chunks, [context] * len(chunks))
+    return [rejection for chunk_rejections in results for rejection in chunk_rejections]